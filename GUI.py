@@ -1,39 +1,183 @@
 import tkinter as tk
 from tkinter import ttk, messagebox, Menu
+import concurrent.futures
 import joblib
+import math
 import numpy as np
 import os
+import queue
+import re
+import threading
+from types import MappingProxyType
 import webbrowser  # For opening documentation links
 
-class ToolTip:
-    """Create a tooltip for any widget"""
-    def __init__(self, widget, text):
-        self.widget = widget
-        self.text = text
-        self.tooltip_window = None
-        widget.bind("<Enter>", self.show_tooltip)
-        widget.bind("<Leave>", self.hide_tooltip)
-
-    def show_tooltip(self, event=None):
-        if self.tooltip_window or not self.text:
+_rbf_kernels = {}
+
+def specialize_rbf_decide(n_features):
+    """Return an RBF-kernel SVM decision function unrolled over n_features inputs
+
+    The generated function takes one raw (unscaled) float32 input row, does its
+    math in float64 like rbf_decide_batch, and is compiled with numba, so the
+    fixed feature count lets the compiler unroll and vectorize the distance
+    sum. numba is an optional dependency, imported on
+    first call (from the prediction worker) so it never delays startup; returns
+    None when it is not installed.
+    """
+    if n_features in _rbf_kernels:
+        return _rbf_kernels[n_features]
+    try:
+        from numba import njit
+    except ImportError:  # numba is optional; the NumPy batch kernel is used instead
+        kernel = None
+    else:
+        scale_lines = "".join(
+            f"    z{j} = (float(x[{j}]) - mean[{j}]) * inv_scale[{j}]\n" for j in range(n_features)
+        )
+        dist = " + ".join(f"(z{j} - sv[i, {j}]) ** 2" for j in range(n_features))
+        src = (
+            "def rbf_decide(x, sv, a, gamma, b, mean, inv_scale):\n"
+            f"{scale_lines}"
+            "    acc = b\n"
+            "    for i in range(sv.shape[0]):\n"
+            f"        d = {dist}\n"
+            "        acc += a[i] * exp(-gamma * d)\n"
+            "    return acc\n"
+        )
+        namespace = {'exp': math.exp}
+        exec(src, namespace)
+        # Generated code has no source file, so numba's on-disk cache cannot be used
+        kernel = njit(fastmath=True)(namespace['rbf_decide'])
+    _rbf_kernels[n_features] = kernel
+    return kernel
+
+def rbf_decide_batch(X, sv, sv_sq, a, gamma, b, mean, inv_scale):
+    """RBF-kernel SVM decision values for every raw input row of X at once"""
+    # Parameters are stored as float32, but the math runs in float64 so extreme
+    # inputs can't overflow the squared distances into inf/NaN
+    Z = (X.astype(np.float64) - mean) * inv_scale
+    x_sq = (Z * Z).sum(axis=1, keepdims=True)
+    # ||z - sv||^2 = ||z||^2 + ||sv||^2 - 2 z.sv, so one matrix product covers all rows
+    D = np.maximum(x_sq + sv_sq[None, :] - 2.0 * (Z @ sv.T), 0.0)
+    K = np.exp(-gamma * D)
+    return K @ a + b
+
+# Option maps are shared read-only across all predictor instances
+_SEX_OPTS = MappingProxyType({'Male': 1, 'Female': 0})
+_CHEST_PAIN_OPTS = MappingProxyType({
+    'Typical angina': 1,
+    'Atypical angina': 2,
+    'Non-anginal pain': 3,
+    'Asymptomatic': 4
+})
+_YES_NO_OPTS = MappingProxyType({'Yes': 1, 'No': 0})
+_RESTING_ECG_OPTS = MappingProxyType({
+    'normal': 0,
+    'ST-T abnormality': 1,
+    'Left ventricular hypertrophy': 2
+})
+_ST_SLOPE_OPTS = MappingProxyType({
+    'upsloping': 1,
+    'flat': 2,
+    'downsloping': 3
+})
+
+# (label, feature key, options or None for numeric, tooltip) in model feature order
+_FIELDS = (
+    ('Age (years)', 'age', None, 'Patient\'s age in years'),
+    ('Sex', 'sex', _SEX_OPTS, 'Select patient gender'),
+    ('Chest Pain Type', 'chest pain type', _CHEST_PAIN_OPTS, 'Type of chest pain experienced'),
+    ('Resting BP (mm Hg)', 'resting bp s', None, 'Blood pressure at rest (mm Hg)'),
+    ('Cholesterol (mg/dl)', 'cholesterol', None, 'Serum cholesterol level'),
+    ('Fasting Blood Sugar >120mg/dl', 'fasting blood sugar', 
+     _YES_NO_OPTS, 'Is fasting blood sugar above 120 mg/dl?'),
+    ('Resting ECG', 'resting ecg', _RESTING_ECG_OPTS, 'ECG measurement results'),
+    ('Max Heart Rate', 'max heart rate', None, 'Maximum heart rate achieved'),
+    ('Exercise Angina', 'exercise angina', _YES_NO_OPTS, 
+     'Does exercise cause angina?'),
+    ('Oldpeak', 'oldpeak', None, 'ST depression induced by exercise'),
+    ('ST Slope', 'ST slope', _ST_SLOPE_OPTS, 'The slope of the peak exercise ST segment'),
+)
+
+# StandardScaler parameters exported from scaler.pkl (mean_ and scale_), in
+# _FIELDS order; re-export them if scaler.pkl is retrained
+_SCALER_MEAN = (
+    53.75420168067227, 0.7615546218487395, 3.235294117647059, 132.35819327731093,
+    209.5441176470588, 0.2184873949579832, 0.6848739495798319, 139.69747899159663,
+    0.37815126050420167, 0.9226890756302527, 1.6123949579831933,
+)
+_SCALER_SCALE = (
+    9.386455644851809, 0.4261328194231955, 0.938941674502017, 18.583528672246914,
+    103.12601487689456, 0.4132198606098925, 0.8717449568684517, 25.959504540677543,
+    0.4849256486135646, 1.0954690469099504, 0.6080463095821095,
+)
+
+# Result panel texts; the risk templates take the model name via %-formatting
+_IDLE_RESULT = (
+    "Heart disease risk assessment results will be shown here\n"
+    "Note: This tool provides preliminary analysis only - consult a physician for diagnosis"
+)
+_HIGH_RISK_TMPL = (
+    "Model: %s\n"
+    "⚠️ High Risk of Heart Disease Detected\n"
+    "This is a preliminary analysis suggesting increased risk.\n"
+    "Please consult a cardiologist for comprehensive evaluation."
+)
+_LOW_RISK_TMPL = (
+    "Model: %s\n"
+    "✅ Low Risk of Heart Disease Detected\n"
+    "No significant indicators found in this analysis.\n"
+    "Regular checkups are still recommended for preventive care."
+)
+
+_NUMERIC_RE = re.compile(r'\s*[+-]?(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?\s*')
+
+def _looks_numeric(s):
+    """Return True if the string is a plain decimal number, without raising"""
+    return _NUMERIC_RE.fullmatch(s) is not None
+
+class _TooltipManager:
+    """Show tooltips for registered widgets using one shared, reusable window"""
+    def __init__(self, root):
+        self.root = root
+        self.texts = {}
+        self._tw = None
+        self._label = None
+        root.bind_all("<Enter>", self._on_enter, add="+")
+        root.bind_all("<Leave>", self._on_leave, add="+")
+
+    def register(self, widget, text):
+        self.texts[str(widget)] = text
+
+    def _ensure_window(self):
+        if self._tw is None:
+            self._tw = tk.Toplevel(self.root)
+            self._tw.withdraw()
+            self._tw.wm_overrideredirect(True)
+            self._label = tk.Label(self._tw, background="#ffffe0", 
+                                   relief='solid', borderwidth=1, font=("Helvetica", 8))
+            self._label.pack(ipadx=1)
+        return self._tw
+
+    def _on_enter(self, event):
+        text = self.texts.get(str(event.widget))
+        if not text:
             return
-        x = y = 0
-        x = self.widget.winfo_pointerx() + 10
-        y = self.widget.winfo_pointery() + 10
-        self.tooltip_window = tw = tk.Toplevel(self.widget)
-        tw.wm_overrideredirect(True)
+        tw = self._ensure_window()
+        self._label.configure(text=text)
+        x = self.root.winfo_pointerx() + 10
+        y = self.root.winfo_pointery() + 10
         tw.wm_geometry(f"+{x}+{y}")
-        label = tk.Label(tw, text=self.text, background="#ffffe0", 
-                        relief='solid', borderwidth=1, font=("Helvetica", 8))
-        label.pack(ipadx=1)
+        tw.deiconify()
+        tw.lift()
 
-    def hide_tooltip(self, event=None):
-        tw = self.tooltip_window
-        if tw:
-            tw.destroy()
-            self.tooltip_window = None
+    def _on_leave(self, event):
+        if self._tw is not None and str(event.widget) in self.texts:
+            self._tw.withdraw()
 
 class HeartDiseasePredictor:
+    # Tcl variable marking an interpreter whose ttk styles are already configured
+    _STYLES_MARKER = "heart_predictor_styles_configured"
+
     def __init__(self, root):
         # Initialize main window
         self.root = root
@@ -42,40 +186,56 @@ class HeartDiseasePredictor:
         self.root.minsize(600, 700)
         
         # Configure styles
-        self.style = ttk.Style()
+        self.style = ttk.Style(self.root)
         self.configure_styles()
         
-        # Load models and scaler
-        self.models = self.load_models()
-        self.scaler = self.load_scaler()
+        # Register models and load scaler
+        self.load_models()
+        self._mean, scale = self.load_scaler()
+        self._inv_scale = 1.0 / scale
         
         # Initialize UI
+        self._tips = _TooltipManager(self.root)
+        self._help_win = None
+        self._info_win = None
         self.create_menu()
         self.create_widgets()
         self.set_default_values()
         
+        # Reusable input row for predictions, in feature order
+        self._feature_buf = np.empty((1, len(self._keys)), dtype=np.float32)
+        
+        # Single daemon worker: predictions run in order and never block exit
+        self._predict_queue = queue.Queue()
+        threading.Thread(target=self._predict_worker, daemon=True).start()
+        
+        # Warm the model cache without blocking the UI
+        self.start_background_load()
+        
         # Bind global shortcuts
         self.root.bind("<Control-q>", lambda e: self.root.destroy())
         self.root.bind("<Control-p>", lambda e: self.predict())
 
     def configure_styles(self):
         """Configure custom UI styles"""
+        # ttk styles live in the Tk interpreter, so the marker is stored there too
+        if self.root.tk.call("info", "exists", self._STYLES_MARKER):
+            return
         self.style.configure("Header.TLabel", font=("Helvetica", 10, "bold"))
         self.style.configure("Result.TLabel", padding=10, relief="flat")
         self.style.configure("Accent.TButton", font=("Helvetica", 9, "bold"))
         self.style.configure("Valid.TEntry", fieldbackground="white")
         self.style.configure("Invalid.TEntry", fieldbackground="#ffe6e6")
         self.style.configure("Info.TLabel", foreground="#1a73e8")
+        self.root.setvar(self._STYLES_MARKER, 1)
 
     def load_scaler(self):
-        """Load and validate scaler"""
-        try:
-            return joblib.load('scaler.pkl')
-        except Exception as e:
-            self.show_error("Critical Error", "Failed to load feature scaler", fatal=True)
+        """Return feature scaling parameters as float32 (mean, scale) arrays"""
+        return (np.array(_SCALER_MEAN, dtype=np.float32), 
+                np.array(_SCALER_SCALE, dtype=np.float32))
 
     def load_models(self):
-        """Load all models at startup for faster predictions"""
+        """Register model files; each model is deserialized on first use"""
         model_paths = {
             'BFO': 'Models/bfo_optimize_svm_model.pkl',
             'ACO': 'Models/aco_optimize_svm_model.pkl',
@@ -84,23 +244,128 @@ class HeartDiseasePredictor:
             'ABC': 'Models/abc_optimize_svm_model.pkl'
         }
         
-        loaded_models = {}
-        failed_models = []
+        available = {key: path for key, path in model_paths.items() if os.path.exists(path)}
+        for key in [k for k in model_paths if k not in available]:
+            messagebox.showwarning(
+                "Model Warning", 
+                f"Could not find {key} model. File might be missing."
+            )
         
-        for key, path in model_paths.items():
+        if not available:
+            self.show_error("Startup Error", "No models could be loaded", fatal=True)
+            
+        self.model_paths = available
+        self.models = {}
+        self._fast_models = {}
+        return self.model_paths
+
+    def _is_loaded(self, key):
+        """Check whether a model is already held in either cache"""
+        return key in self.models or key in self._fast_models
+
+    def _get_model(self, key):
+        """Load and cache the requested model on first use
+
+        Returns the sklearn estimator, or None when the model has been reduced
+        to float32 kernel parameters in self._fast_models.
+        """
+        if not self._is_loaded(key):
             try:
-                loaded_models[key] = joblib.load(path)
+                model = joblib.load(self.model_paths[key], mmap_mode='r')
             except Exception as e:
-                failed_models.append(key)
-                messagebox.showwarning(
-                    "Model Warning", 
-                    f"Could not load {key} model. File might be missing or corrupted."
-                )
+                raise RuntimeError(
+                    f"Could not load {key} model. File might be corrupted."
+                ) from e
+            self._cache_model(key, model)
+        return self.models.get(key)
+
+    def _cache_model(self, key, model):
+        """Keep a loaded model, or only its float32 kernel parameters for RBF SVMs"""
+        # Models are loaded with mmap_mode='r'; anything retained must be a real
+        # copy so the .pkl files are unmapped (and not locked on Windows)
+        if model.kernel != 'rbf' or len(model.classes_) != 2:
+            for name, value in vars(model).items():
+                if isinstance(value, np.memmap):
+                    setattr(model, name, np.array(value))
+            self.models[key] = model
+        else:
+            # The float64 estimator is dropped so only the float32 copies stay resident
+            sv = np.ascontiguousarray(model.support_vectors_, dtype=np.float32)
+            self._fast_models[key] = (
+                sv,
+                np.ascontiguousarray(model.dual_coef_[0], dtype=np.float32),
+                np.float32(model._gamma),
+                np.float32(model.intercept_[0]),
+                np.array(model.classes_),
+                (sv * sv).sum(axis=1),
+            )
+
+    def predict_batch(self, X, model_key):
+        """Predict class labels for raw feature rows (any array-like, 1-D or 2-D)"""
+        # No copy for float32 arrays such as the prediction buffer
+        X = np.atleast_2d(np.asarray(X, dtype=np.float32))
+        model = self._get_model(model_key)
+        fast = self._fast_models.get(model_key)
+        if fast is None:
+            return model.predict((X - self._mean) * self._inv_scale)
+        sv, a, gamma, b, classes, sv_sq = fast
+        scores = rbf_decide_batch(X, sv, sv_sq, a, gamma, b, self._mean, self._inv_scale)
+        if not np.isfinite(scores).all():
+            # NaN > 0 is False, which would silently read as the negative class
+            raise ValueError("Input values are out of range for the model")
+        return classes[(scores > 0).astype(np.intp)]
+
+    def start_background_load(self):
+        """Deserialize models on a worker thread while the UI stays responsive"""
+        self.predict_btn.state(['disabled'])
+        self.status_bar.config(text="Loading models...")
+        self._load_queue = queue.Queue()
+        pending = dict(self.model_paths)
+        threading.Thread(target=self._bg_load, args=(pending,), daemon=True).start()
+        self.root.after(50, self._poll_model_queue)
+
+    def _bg_load(self, model_paths):
+        """Worker thread: load each model and hand it to the Tk thread"""
+        for key, path in model_paths.items():
+            try:
+                model = joblib.load(path, mmap_mode='r')
+            except Exception:
+                model = None
+            self._load_queue.put((key, model))
+        self._load_queue.put((None, None))
+
+    def _poll_model_queue(self):
+        """Tk thread: collect models finished by the worker"""
+        while True:
+            try:
+                key, model = self._load_queue.get_nowait()
+            except queue.Empty:
+                self.root.after(50, self._poll_model_queue)
+                return
+            if key is None:
+                break
+            self._on_model_loaded(key, model)
         
-        if not loaded_models:
+        if not self.model_paths:
             self.show_error("Startup Error", "No models could be loaded", fatal=True)
-            
-        return loaded_models
+        self.predict_btn.state(['!disabled'])
+        self.status_bar.config(text="Ready")
+
+    def _on_model_loaded(self, key, model):
+        """Cache a loaded model or drop a model that failed to load"""
+        if model is not None:
+            if not self._is_loaded(key):
+                self._cache_model(key, model)
+            return
+        
+        self.model_paths.pop(key, None)
+        self.model_combo['values'] = list(self.model_paths.keys())
+        if self.model_var.get() not in self.model_paths and self.model_paths:
+            self.model_combo.current(0)
+        messagebox.showwarning(
+            "Model Warning", 
+            f"Could not load {key} model. File might be corrupted."
+        )
 
     def create_menu(self):
         """Create application menu bar"""
@@ -128,8 +393,10 @@ class HeartDiseasePredictor:
         input_frame = ttk.LabelFrame(self.root, text="Patient Assessment Parameters", padding=15)
         input_frame.pack(fill="x", padx=15, pady=10)
         
-        # Grid layout for input fields
-        self.entries = {}
+        # Grid layout for input fields; parallel lists in feature order
+        self._keys = []
+        self._widgets = []
+        self._opts = []
         self.validation_traces = {}  # For real-time validation
         
         for i, (label_text, key, opts, tooltip) in enumerate(self.get_field_definitions()):
@@ -137,36 +404,39 @@ class HeartDiseasePredictor:
             label = ttk.Label(input_frame, text=label_text, style="Header.TLabel")
             label.grid(row=i, column=0, padx=5, pady=8, sticky="e")
             
-            # Widget container
-            widget_frame = ttk.Frame(input_frame)
-            widget_frame.grid(row=i, column=1, padx=5, pady=5, sticky="w")
-            
             # Create appropriate widget
             if opts:
-                combo = ttk.Combobox(widget_frame, values=list(opts.keys()), 
+                combo = ttk.Combobox(input_frame, values=list(opts.keys()), 
                                    state='readonly', width=25)
-                combo.pack(side="left")
+                combo.grid(row=i, column=1, padx=5, pady=5, sticky="w")
                 combo.current(0)
-                self.entries[key] = (combo, opts)
+                # Resolve the option value at selection time, not on every predict()
+                combo._value = opts[combo.get()]
+                combo.bind("<<ComboboxSelected>>", 
+                           lambda e, c=combo, o=opts: setattr(c, '_value', o[c.get()]))
+                widget = combo
                 
                 # Add tooltip
-                ToolTip(combo, tooltip)
+                self._tips.register(combo, tooltip)
                 
             else:
-                entry = ttk.Entry(widget_frame, width=30)
-                entry.pack(side="left")
-                self.entries[key] = (entry, None)
+                entry = ttk.Entry(input_frame, width=30)
+                entry.grid(row=i, column=1, padx=5, pady=5, sticky="w")
+                widget = entry
                 
                 # Add validation
                 self.add_validation(entry)
                 
                 # Add tooltip
-                ToolTip(entry, tooltip)
+                self._tips.register(entry, tooltip)
                 
-            # Add info icon with tooltip
-            info_icon = ttk.Label(widget_frame, text="ⓘ", style="Info.TLabel")
-            info_icon.pack(side="left", padx=(5, 0))
-            ToolTip(info_icon, tooltip)
+            self._keys.append(key)
+            self._widgets.append(widget)
+            self._opts.append(opts)
+            
+            # Add info icon (the input widget already carries the tooltip)
+            info_icon = ttk.Label(input_frame, text="ⓘ", style="Info.TLabel")
+            info_icon.grid(row=i, column=2, padx=(0, 5), sticky="w")
 
         # Model selection
         model_frame = ttk.Frame(self.root, padding=10)
@@ -175,12 +445,12 @@ class HeartDiseasePredictor:
         ttk.Label(model_frame, text="Prediction Model:", style="Header.TLabel").pack(side="left")
         self.model_var = tk.StringVar()
         self.model_combo = ttk.Combobox(model_frame, textvariable=self.model_var,
-                                       values=list(self.models.keys()), 
+                                       values=list(self.model_paths.keys()), 
                                        state='readonly', width=15)
         self.model_combo.pack(side="left", padx=5)
-        if self.models:
+        if self.model_paths:
             self.model_combo.current(0)
-        ToolTip(self.model_combo, "Select optimization algorithm used for prediction")
+        self._tips.register(self.model_combo, "Select optimization algorithm used for prediction")
         
         # Action buttons
         button_frame = ttk.Frame(self.root, padding=10)
@@ -189,12 +459,12 @@ class HeartDiseasePredictor:
         self.predict_btn = ttk.Button(button_frame, text="Analyze Risk", 
                                     command=self.predict, style="Accent.TButton")
         self.predict_btn.pack(side="left", padx=5)
-        ToolTip(self.predict_btn, "Run analysis with selected model (Ctrl+P)")
+        self._tips.register(self.predict_btn, "Run analysis with selected model (Ctrl+P)")
         
         self.clear_btn = ttk.Button(button_frame, text="Clear Fields", 
                                    command=self.clear_fields)
         self.clear_btn.pack(side="left", padx=5)
-        ToolTip(self.clear_btn, "Reset all fields to empty (Ctrl+Alt+N)")
+        self._tips.register(self.clear_btn, "Reset all fields to empty (Ctrl+Alt+N)")
         
         # Result display
         self.result_var = tk.StringVar()
@@ -202,8 +472,7 @@ class HeartDiseasePredictor:
                                     wraplength=500, justify="center", padding=15,
                                     relief="groove", style="Result.TLabel")
         self.result_label.pack(fill="x", padx=15, pady=10, ipady=10)
-        self.result_var.set("Heart disease risk assessment results will be shown here\n"
-                          "Note: This tool provides preliminary analysis only - consult a physician for diagnosis")
+        self.result_var.set(_IDLE_RESULT)
         
         # Status bar
         self.status_bar = ttk.Label(self.root, text="Ready", relief="sunken")
@@ -211,50 +480,33 @@ class HeartDiseasePredictor:
 
     def get_field_definitions(self):
         """Return enhanced field definitions with tooltips"""
-        return [
-            ('Age (years)', 'age', None, 'Patient\'s age in years'),
-            ('Sex', 'sex', {'Male': 1, 'Female': 0}, 'Select patient gender'),
-            ('Chest Pain Type', 'chest pain type', {
-                'Typical angina': 1,
-                'Atypical angina': 2,
-                'Non-anginal pain': 3,
-                'Asymptomatic': 4
-            }, 'Type of chest pain experienced'),
-            ('Resting BP (mm Hg)', 'resting bp s', None, 'Blood pressure at rest (mm Hg)'),
-            ('Cholesterol (mg/dl)', 'cholesterol', None, 'Serum cholesterol level'),
-            ('Fasting Blood Sugar >120mg/dl', 'fasting blood sugar', 
-             {'Yes': 1, 'No': 0}, 'Is fasting blood sugar above 120 mg/dl?'),
-            ('Resting ECG', 'resting ecg', {
-                'normal': 0,
-                'ST-T abnormality': 1,
-                'Left ventricular hypertrophy': 2
-            }, 'ECG measurement results'),
-            ('Max Heart Rate', 'max heart rate', None, 'Maximum heart rate achieved'),
-            ('Exercise Angina', 'exercise angina', {'Yes': 1, 'No': 0}, 
-             'Does exercise cause angina?'),
-            ('Oldpeak', 'oldpeak', None, 'ST depression induced by exercise'),
-            ('ST Slope', 'ST slope', {
-                'upsloping': 1,
-                'flat': 2,
-                'downsloping': 3
-            }, 'The slope of the peak exercise ST segment'),
-        ]
+        return _FIELDS
 
     def add_validation(self, entry):
         """Add real-time validation to entry fields"""
         def validate(*args):
             value = entry_var.get()
-            if not value:
-                entry.configure(style="Valid.TEntry")
+            is_valid = (not value) or _looks_numeric(value)
+            # Parse once per edit so predict() can reuse the value; the regex can
+            # accept strings float() rejects (e.g. trailing '\x1c'), so guard it
+            entry._value = None
+            if value and is_valid:
+                try:
+                    entry._value = float(value)
+                except ValueError:
+                    is_valid = False
+            if is_valid == entry._last_valid:
                 return
-            try:
-                float(value)
+            entry._last_valid = is_valid
+            if is_valid:
                 entry.configure(style="Valid.TEntry")
                 self.status_bar.config(text="Ready")
-            except ValueError:
+            else:
                 entry.configure(style="Invalid.TEntry")
                 self.status_bar.config(text="Error: Numeric value required")
         
+        entry._last_valid = None
+        entry._value = None
         entry_var = tk.StringVar()
         entry.config(textvariable=entry_var)
         entry_var.trace("w", validate)
@@ -269,26 +521,35 @@ class HeartDiseasePredictor:
             'max heart rate': '150',
             'oldpeak': '1.0'
         }
-        for key, value in defaults.items():
-            if key in self.entries and isinstance(self.entries[key][0], ttk.Entry):
-                self.entries[key][0].delete(0, tk.END)
-                self.entries[key][0].insert(0, value)
+        for key, widget in zip(self._keys, self._widgets):
+            if key in defaults and isinstance(widget, ttk.Entry):
+                widget.delete(0, tk.END)
+                widget.insert(0, defaults[key])
 
     def validate_inputs(self):
         """Validate all input fields before prediction"""
         try:
-            for key, (widget, opts) in self.entries.items():
+            for key, widget, opts in zip(self._keys, self._widgets, self._opts):
                 if opts is None:
                     val = widget.get().strip()
                     if not val:
                         raise ValueError(f"{key.capitalize()} cannot be empty")
-                    try:
-                        float(val)
-                    except ValueError:
+                    # _value is what predict() uses, so it must hold the parsed value
+                    if not _looks_numeric(val) or widget._value is None:
                         raise ValueError(f"{key.capitalize()} must be a numeric value")
                 else:
                     if widget.get() not in opts:
                         raise ValueError(f"Invalid selection for {key}")
+            
+            # Check the row the kernels will see: float32 values (1e400 or 1e39
+            # become inf), scaled and squared in float64
+            with np.errstate(over='ignore'):
+                row = np.array([w._value for w in self._widgets], dtype=np.float32)
+                z = (row.astype(np.float64) - self._mean) * self._inv_scale
+                out_of_range = np.flatnonzero(~np.isfinite(z * z))
+            if out_of_range.size:
+                key = self._keys[out_of_range[0]]
+                raise ValueError(f"{key.capitalize()} is out of range")
             return True
         except ValueError as ve:
             messagebox.showerror("Validation Error", str(ve))
@@ -296,62 +557,84 @@ class HeartDiseasePredictor:
 
     def predict(self, event=None):
         """Handle prediction request with enhanced visualization"""
+        if self.predict_btn.instate(['disabled']):
+            return
         if not self.validate_inputs():
             return
             
         try:
             # Gather input data
-            data = []
-            for key, (widget, opts) in self.entries.items():
-                if opts:
-                    val = opts[widget.get()]
-                else:
-                    val = float(widget.get())
-                data.append(val)
-            
-            arr = np.array([data])
-            X_new = self.scaler.transform(arr)
-            
-            model_key = self.model_var.get()
-            model = self.models[model_key]
-            pred = model.predict(X_new)[0]
-            
-            # Display result with visual feedback
-            if pred == 1:
-                result_text = (
-                    f"Model: {model_key}\n"
-                    "⚠️ High Risk of Heart Disease Detected\n"
-                    "This is a preliminary analysis suggesting increased risk.\n"
-                    "Please consult a cardiologist for comprehensive evaluation."
-                )
-                self.result_label.configure(foreground="darkred")
-            else:
-                result_text = (
-                    f"Model: {model_key}\n"
-                    "✅ Low Risk of Heart Disease Detected\n"
-                    "No significant indicators found in this analysis.\n"
-                    "Regular checkups are still recommended for preventive care."
-                )
-                self.result_label.configure(foreground="darkgreen")
-            
-            self.result_var.set(result_text)
-            self.status_bar.config(text="Prediction completed successfully")
-            
+            buf = self._feature_buf
+            for i, widget in enumerate(self._widgets):
+                buf[0, i] = widget._value
         except Exception as e:
             self.show_error("Analysis Failed", str(e))
+            return
+        
+        # Run inference off the Tk thread and poll for the result
+        model_key = self.model_var.get()
+        self.predict_btn.state(['disabled'])
+        self.status_bar.config(text="Analyzing...")
+        future = concurrent.futures.Future()
+        self._predict_queue.put((future, buf.copy(), model_key))
+        self._poll_prediction(future, model_key)
+
+    def _predict_worker(self):
+        """Worker thread: run queued predictions; daemon, so exit never waits on it"""
+        while True:
+            future, X, model_key = self._predict_queue.get()
+            try:
+                future.set_result(self._do_predict(X, model_key))
+            except Exception as e:
+                future.set_exception(e)
+
+    def _do_predict(self, X, model_key):
+        """Worker thread: classify one raw feature row without touching Tk"""
+        self._get_model(model_key)  # Loads the model and its kernel parameters
+        fast = self._fast_models.get(model_key)
+        rbf_decide = specialize_rbf_decide(fast[0].shape[1]) if fast is not None else None
+        if rbf_decide is not None:
+            sv, a, gamma, b, classes, _ = fast
+            score = rbf_decide(X[0], sv, a, gamma, b, self._mean, self._inv_scale)
+            if not math.isfinite(score):
+                raise ValueError("Input values are out of range for the model")
+            return classes[int(score > 0)]
+        return self.predict_batch(X, model_key)[0]
+
+    def _poll_prediction(self, future, model_key):
+        """Tk thread: wait for a submitted prediction and display it"""
+        if not future.done():
+            self.root.after(20, self._poll_prediction, future, model_key)
+            return
+        self.predict_btn.state(['!disabled'])
+        
+        try:
+            pred = future.result()
+        except Exception as e:
+            self.status_bar.config(text="Ready")
+            self.show_error("Analysis Failed", str(e))
+            return
+        
+        # Display result with visual feedback
+        if pred == 1:
+            self.result_var.set(_HIGH_RISK_TMPL % model_key)
+            self.result_label.configure(foreground="darkred")
+        else:
+            self.result_var.set(_LOW_RISK_TMPL % model_key)
+            self.result_label.configure(foreground="darkgreen")
+        
+        self.status_bar.config(text="Prediction completed successfully")
 
     def clear_fields(self, event=None):
         """Reset all input fields and results"""
-        for key, (widget, opts) in self.entries.items():
+        for widget, opts in zip(self._widgets, self._opts):
             if opts is None:
                 widget.delete(0, tk.END)  # Clear field without setting defaults
             else:
                 widget.current(0)
+                widget._value = opts[widget.get()]
         
-        self.result_var.set(
-            "Heart disease risk assessment results will be shown here\n"
-            "Note: This tool provides preliminary analysis only - consult a physician for diagnosis"
-        )
+        self.result_var.set(_IDLE_RESULT)
         self.result_label.configure(foreground="black")
         self.status_bar.config(text="Fields cleared")
 
@@ -388,16 +671,8 @@ class HeartDiseasePredictor:
         - Results should be interpreted in conjunction with clinical findings
         """
         
-        help_window = tk.Toplevel(self.root)
-        help_window.title("User Guide")
-        help_window.geometry("600x400")
-        
-        text_widget = tk.Text(help_window, wrap="word", padx=10, pady=10)
-        text_widget.pack(fill="both", expand=True)
-        text_widget.insert("1.0", help_text)
-        text_widget.configure(state="disabled")
-        
-        ttk.Button(help_window, text="Close", command=help_window.destroy).pack(pady=5)
+        self._help_win = self.show_text_window(self._help_win, "User Guide", 
+                                               "600x400", help_text)
 
     def show_model_info(self):
         """Show detailed model information"""
@@ -424,16 +699,29 @@ class HeartDiseasePredictor:
            - Swarm intelligence-based algorithm
            - Simulates honey bees' foraging behavior
         """
-        info_window = tk.Toplevel(self.root)
-        info_window.title("Model Information")
-        info_window.geometry("500x400")
-        
-        text_widget = tk.Text(info_window, wrap="word", padx=10, pady=10)
+        self._info_win = self.show_text_window(self._info_win, "Model Information", 
+                                               "500x400", info)
+
+    def show_text_window(self, window, title, geometry, text):
+        """Show a read-only text dialog, building it only on first use"""
+        if window is not None and window.winfo_exists():
+            window.deiconify()
+            window.lift()
+            return window
+        
+        window = tk.Toplevel(self.root)
+        window.title(title)
+        window.geometry(geometry)
+        # Closing hides the dialog so the next open reuses it
+        window.protocol("WM_DELETE_WINDOW", window.withdraw)
+        
+        text_widget = tk.Text(window, wrap="word", padx=10, pady=10)
         text_widget.pack(fill="both", expand=True)
-        text_widget.insert("1.0", info)
+        text_widget.insert("1.0", text)
         text_widget.configure(state="disabled")
         
-        ttk.Button(info_window, text="Close", command=info_window.destroy).pack(pady=5)
+        ttk.Button(window, text="Close", command=window.withdraw).pack(pady=5)
+        return window
 
     def show_about(self):
         """Show application information"""
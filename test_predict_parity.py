@@ -0,0 +1,67 @@
+"""Check the hand-written RBF kernels against sklearn's SVC.predict"""
+import os
+
+import pytest
+
+np = pytest.importorskip("numpy")
+joblib = pytest.importorskip("joblib")
+pytest.importorskip("sklearn")
+
+import GUI
+
+REPO_DIR = os.path.dirname(os.path.abspath(__file__))
+MODEL_KEYS = ['BFO', 'ACO', 'DE', 'GA', 'ABC']
+
+# Form defaults (first option of every combobox) with an extreme oldpeak,
+# which overflowed the float32 kernel and flipped the diagnosis
+EXTREME_ROW = [50, 1, 1, 120, 200, 1, 0, 150, 1, 1e38, 1]
+
+
+@pytest.fixture(scope="module")
+def app():
+    """Predictor with models and scaler loaded but no Tk window"""
+    cwd = os.getcwd()
+    os.chdir(REPO_DIR)
+    try:
+        predictor = GUI.HeartDiseasePredictor.__new__(GUI.HeartDiseasePredictor)
+        predictor.load_models()
+        predictor._mean, scale = predictor.load_scaler()
+        predictor._inv_scale = 1.0 / scale
+        yield predictor
+    finally:
+        os.chdir(cwd)
+
+
+@pytest.fixture(scope="module")
+def rows():
+    data = np.genfromtxt(os.path.join(REPO_DIR, 'heart.csv'), delimiter=',', skip_header=1)
+    return np.vstack([data[:, :-1], EXTREME_ROW])
+
+
+@pytest.fixture(scope="module")
+def expected():
+    """sklearn predictions for every model on the test rows"""
+    scaler = joblib.load(os.path.join(REPO_DIR, 'scaler.pkl'))
+    result = {}
+    for key in MODEL_KEYS:
+        model = joblib.load(os.path.join(REPO_DIR, 'Models', f'{key.lower()}_optimize_svm_model.pkl'))
+        result[key] = lambda X, model=model: model.predict(scaler.transform(X))
+    return result
+
+
+@pytest.mark.parametrize("key", MODEL_KEYS)
+def test_predict_batch_matches_sklearn(app, rows, expected, key):
+    np.testing.assert_array_equal(app.predict_batch(rows, key), expected[key](rows))
+
+
+@pytest.mark.parametrize("key", MODEL_KEYS)
+def test_numba_kernel_matches_sklearn(app, rows, expected, key):
+    pytest.importorskip("numba")
+    X = rows.astype(np.float32)
+    predicted = [app._do_predict(X[i:i + 1], key) for i in range(len(X))]
+    np.testing.assert_array_equal(predicted, expected[key](rows))
+
+
+def test_extreme_row_is_high_risk(app):
+    for key in MODEL_KEYS:
+        assert app.predict_batch(EXTREME_ROW, key)[0] == 1